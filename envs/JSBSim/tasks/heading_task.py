@@ -5,13 +5,38 @@ from ..core.catalog import Catalog as c
 from ..reward_functions import AltitudeReward, HeadingReward
 from ..termination_conditions import ExtremeState, LowAltitude, Overload, Timeout, UnreachHeading
 
+# affine transform mapping the fixed MultiDiscrete([41, 41, 41, 30]) action indices
+# onto the continuous action_var ranges: aileron/elevator/rudder [-1, 1], throttle [0.4, 0.9]
+_ACT_SCALE = np.array([2 / 40, 2 / 40, 2 / 40, 0.5 / 29], dtype=np.float32)
+_ACT_BIAS = np.array([-1., -1., -1., 0.4], dtype=np.float32)
+
+# number of slots in the preallocated output arenas; outputs older than
+# this many steps may be overwritten in place
+_ARENA_SIZE = 256
+
 
 class HeadingTask(BaseTask):
     '''
     Control target heading with discrete action space
     '''
+    __slots__ = ('_obs_scale', '_obs_low', '_obs_high',
+                 '_obs_arena', '_obs_arena_idx', '_act_arena', '_act_arena_idx')
+
     def __init__(self, config):
         super().__init__(config)
+        # scales for the linear entries of the observation, see get_obs for the layout
+        # (obs[0:4] -> norm_obs[0:4], obs[6:10] -> norm_obs[8:12]; roll/pitch handled by sin/cos)
+        self._obs_scale = np.array([1 / 1000, np.pi / 180, 1 / 340, 1 / 5000,
+                                    1 / 340, 1 / 340, 1 / 340, 1 / 340], dtype=np.float32)
+        # cached clip bounds, avoids the observation_space attribute chain on every step
+        self._obs_low = self.observation_space.low
+        self._obs_high = self.observation_space.high
+        # preallocated output arenas cycled round-robin, so the last _ARENA_SIZE
+        # outputs stay valid while still avoiding per-step allocations
+        self._obs_arena = np.zeros((_ARENA_SIZE, 12), dtype=np.float32)
+        self._obs_arena_idx = 0
+        self._act_arena = np.zeros((_ARENA_SIZE, 4), dtype=np.float32)
+        self._act_arena_idx = 0
 
         self.reward_functions = [
             HeadingReward(self.config),
@@ -82,29 +107,40 @@ class HeadingTask(BaseTask):
             10. ego v_body_z           (unit: mh)
             11. ego_vc                 (unit: mh)
         """
-        obs = np.array(env.agents[agent_id].get_property_values(self.state_var))
-        norm_obs = np.zeros(12)
-        norm_obs[0] = obs[0] / 1000         # 0. ego delta altitude (unit: 1km)
-        norm_obs[1] = obs[1] / 180 * np.pi  # 1. ego delta heading  (unit rad)
-        norm_obs[2] = obs[2] / 340          # 2. ego delta velocities_u (unit: mh)
-        norm_obs[3] = obs[3] / 5000         # 3. ego_altitude   (unit: 5km)
-        norm_obs[4] = np.sin(obs[4])        # 4. ego_roll_sin
-        norm_obs[5] = np.cos(obs[4])        # 5. ego_roll_cos
-        norm_obs[6] = np.sin(obs[5])        # 6. ego_pitch_sin
-        norm_obs[7] = np.cos(obs[5])        # 7. ego_pitch_cos
-        norm_obs[8] = obs[6] / 340          # 8. ego_v_north    (unit: mh)
-        norm_obs[9] = obs[7] / 340          # 9. ego_v_east     (unit: mh)
-        norm_obs[10] = obs[8] / 340         # 10. ego_v_down    (unit: mh)
-        norm_obs[11] = obs[9] / 340         # 11. ego_vc        (unit: mh)
-        norm_obs = np.clip(norm_obs, self.observation_space.low, self.observation_space.high)
+        obs = np.asarray(env.agents[agent_id].get_property_values(self.state_var), dtype=np.float32)
+        norm_obs = self._obs_arena[self._obs_arena_idx]
+        self._obs_arena_idx = (self._obs_arena_idx + 1) % _ARENA_SIZE
+        np.multiply(obs[:4], self._obs_scale[:4], out=norm_obs[:4])     # 0. delta altitude (unit: 1km)  1. delta heading (unit: rad)
+                                                                        # 2. delta velocities_u (unit: mh)  3. altitude (unit: 5km)
+        np.sin(obs[4:6], out=norm_obs[4:8:2])                           # 4. ego_roll_sin   6. ego_pitch_sin
+        np.cos(obs[4:6], out=norm_obs[5:8:2])                           # 5. ego_roll_cos   7. ego_pitch_cos
+        np.multiply(obs[6:], self._obs_scale[4:], out=norm_obs[8:])     # 8-11. ego v_body_x/y/z, vc (unit: mh)
+        np.clip(norm_obs, self._obs_low, self._obs_high, out=norm_obs)
+        return norm_obs
+
+    def normalize_observations_batch(self, obs_batch):
+        """Batched version of the get_obs normalization for parallel envs.
+
+        Args:
+            obs_batch (np.ndarray): raw state values of shape (N, 10), laid out as state_var
+
+        Returns:
+            (np.ndarray): normalized observations of shape (N, 12)
+        """
+        obs_batch = np.asarray(obs_batch, dtype=np.float32)
+        norm_obs = np.empty((obs_batch.shape[0], 12), dtype=np.float32)
+        np.einsum('ni,i->ni', obs_batch[:, :4], self._obs_scale[:4], out=norm_obs[:, :4])
+        np.sin(obs_batch[:, 4:6], out=norm_obs[:, 4:8:2])
+        np.cos(obs_batch[:, 4:6], out=norm_obs[:, 5:8:2])
+        np.einsum('ni,i->ni', obs_batch[:, 6:], self._obs_scale[4:], out=norm_obs[:, 8:])
+        np.clip(norm_obs, self._obs_low, self._obs_high, out=norm_obs)
         return norm_obs
 
     def normalize_action(self, env, agent_id, action):
         """Convert discrete action index into continuous value.
         """
-        norm_act = np.zeros(4)
-        norm_act[0] = action[0] * 2. / (self.action_space.nvec[0] - 1.) - 1.
-        norm_act[1] = action[1] * 2. / (self.action_space.nvec[1] - 1.) - 1.
-        norm_act[2] = action[2] * 2. / (self.action_space.nvec[2] - 1.) - 1.
-        norm_act[3] = action[3] * 0.5 / (self.action_space.nvec[3] - 1.) + 0.4
+        norm_act = self._act_arena[self._act_arena_idx]
+        self._act_arena_idx = (self._act_arena_idx + 1) % _ARENA_SIZE
+        np.multiply(np.asarray(action, dtype=np.float32), _ACT_SCALE, out=norm_act)
+        norm_act += _ACT_BIAS
         return norm_act
@@ -7,7 +7,6 @@ from ..tasks import SingleCombatTask
 from ..core.catalog import Catalog as c
 from ..core.simulatior import MissileSimulator
 from ..reward_functions import AltitudeReward, PostureReward, EventDrivenReward, MissilePostureReward
-from ..termination_conditions import ExtremeState, LowAltitude, Overload, Timeout, SafeReturn
 from ..utils.utils import get_AO_TA_R, LLA2NEU, get_root_dir
 from ..model.baseline_actor import BaselineActor
 
@@ -15,20 +14,10 @@ from ..model.baseline_actor import BaselineActor
 class MultipleCombatTask(SingleCombatTask):
     def __init__(self, config):
         super().__init__(config)
-
-        self.reward_functions = [
-            AltitudeReward(self.config),
-            PostureReward(self.config),
-            EventDrivenReward(self.config)
-        ]
-
-        self.termination_conditions = [
-            SafeReturn(self.config),
-            ExtremeState(self.config),
-            Overload(self.config),
-            LowAltitude(self.config),
-            Timeout(self.config),
-        ]
+        # reuse the conditions built by SingleCombatTask (reward functions are identical),
+        # only move SafeReturn ahead of LowAltitude in the check order
+        conditions = self.termination_conditions
+        conditions[0], conditions[3] = conditions[3], conditions[0]
 
     @property
     def num_agents(self) -> int:
@@ -328,9 +328,6 @@ class BaselineAgent:
 
 
 class PursueAgent(BaselineAgent):
-    def __init__(self) -> None:
-        super().__init__()
-
     def set_delta_value(self, sim: AircraftSimulator):
         # NOTE: only adapt for 1v1
         ego_x, ego_y, ego_z = sim.get_position()
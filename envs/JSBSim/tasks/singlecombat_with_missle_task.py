@@ -175,10 +175,7 @@ class SingleCombatShootMissileTask(SingleCombatDodgeMissileTask):
     def load_action_space(self):
         # aileron, elevator, rudder, throttle, shoot control
         self.action_space = spaces.Tuple([spaces.MultiDiscrete([41, 41, 41, 30]), spaces.Discrete(2)])
-    
-    def get_obs(self, env, agent_id):
-        return super().get_obs(env, agent_id)
-    
+
     def normalize_action(self, env, agent_id, action):
         self._shoot_action[agent_id] = action[-1]
         return super().normalize_action(env, agent_id, action[:-1].astype(np.int32))
@@ -11,6 +11,10 @@ class BaseTask(ABC):
     A class to subclass in order to create a task with its own observation variables,
     action variables, termination conditions and reward functions.
     """
+    # subclasses without their own __slots__ still get a __dict__ and may add attributes freely
+    __slots__ = ('config', 'reward_functions', 'termination_conditions',
+                 'state_var', 'action_var', 'render_var', 'observation_space', 'action_space')
+
     def __init__(self, config):
         self.config = config
         self.reward_functions = []
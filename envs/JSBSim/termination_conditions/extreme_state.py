@@ -8,9 +8,6 @@ class ExtremeState(BaseTerminationCondition):
     End up the simulation if the aircraft is on an extreme state.
     """
 
-    def __init__(self, config):
-        super().__init__(config)
-
     def get_termination(self, task, env, agent_id, info={}):
         """
         Return whether the episode should terminate.
@@ -1,4 +1,4 @@
-import math
+import numpy as np
 from .termination_condition_base import BaseTerminationCondition
 from ..core.catalog import Catalog as c
 
@@ -8,12 +8,23 @@ class Overload(BaseTerminationCondition):
     Overload
     End up the simulation if acceleration are too high.
     """
+    __slots__ = ('_accel_props', '_limits', '_z_bias')
+
+    _DEFAULTS = {
+        'acceleration_limit_x': 10.0,   # unit: g
+        'acceleration_limit_y': 10.0,   # unit: g
+        'acceleration_limit_z': 10.0,   # unit: g
+    }
 
     def __init__(self, config):
         super().__init__(config)
-        self.acceleration_limit_x = getattr(config, 'acceleration_limit_x', 10.0)  # unit: g
-        self.acceleration_limit_y = getattr(config, 'acceleration_limit_y', 10.0)  # unit: g
-        self.acceleration_limit_z = getattr(config, 'acceleration_limit_z', 10.0)  # unit: g
+        self._accel_props = [
+            c.accelerations_n_pilot_x_norm,
+            c.accelerations_n_pilot_y_norm,
+            c.accelerations_n_pilot_z_norm,
+        ]
+        self._limits = np.array([getattr(config, key, default) for key, default in self._DEFAULTS.items()])
+        self._z_bias = np.array([0.0, 0.0, 1.0])  # nz measures -1g in level flight
 
     def get_termination(self, task, env, agent_id, info={}):
         """
@@ -30,15 +41,14 @@ class Overload(BaseTerminationCondition):
         done = self._judge_overload(env.agents[agent_id])
         if done:
             env.agents[agent_id].crash()
-            self.log(f'{agent_id} acceleration is too high! Total Steps={env.current_step}')
+            self.log('%s acceleration is too high! Total Steps=%d', agent_id, env.current_step)
         success = False
         return done, success, info
 
     def _judge_overload(self, sim):
-        flag_overload = False
-        if sim.get_property_value(c.simulation_sim_time_sec) > 10:
-            if math.fabs(sim.get_property_value(c.accelerations_n_pilot_x_norm)) > self.acceleration_limit_x \
-                    or math.fabs(sim.get_property_value(c.accelerations_n_pilot_y_norm)) > self.acceleration_limit_y \
-                    or math.fabs(sim.get_property_value(c.accelerations_n_pilot_z_norm) + 1) > self.acceleration_limit_z:
-                flag_overload = True
-        return flag_overload
+        # overload is not judged during the first 10s of each episode,
+        # so skip the acceleration fetches entirely until then
+        if sim.get_property_value(c.simulation_sim_time_sec) <= 10:
+            return False
+        accelerations = np.array(sim.get_property_values(self._accel_props))
+        return bool(np.any(np.abs(accelerations + self._z_bias) > self._limits))
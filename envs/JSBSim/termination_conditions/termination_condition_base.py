@@ -7,6 +7,8 @@ class BaseTerminationCondition(ABC):
     Base TerminationCondition class
     Condition-specific get_termination method is implemented in subclasses
     """
+    # subclasses without their own __slots__ still get a __dict__ and may add attributes freely
+    __slots__ = ('config',)
 
     def __init__(self, config):
         self.config = config
@@ -26,5 +28,7 @@ class BaseTerminationCondition(ABC):
         """
         raise NotImplementedError
 
-    def log(self, msg):
-        logging.debug(msg)
+    def log(self, msg, *args):
+        # extra args are deferred to logging's lazy %-formatting,
+        # so no string is built when the DEBUG level is filtered out
+        logging.debug(msg, *args)
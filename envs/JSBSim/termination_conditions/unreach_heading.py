@@ -1,4 +1,3 @@
-import math
 from ..core.catalog import Catalog as c
 from .termination_condition_base import BaseTerminationCondition
 
@@ -37,7 +36,7 @@ class UnreachHeading(BaseTerminationCondition):
         check_time = env.agents[agent_id].get_property_value(c.heading_check_time)
         # check heading when simulation_time exceed check_time
         if env.agents[agent_id].get_property_value(c.simulation_sim_time_sec) >= check_time:
-            if math.fabs(env.agents[agent_id].get_property_value(c.delta_heading)) > 10:
+            if abs(env.agents[agent_id].get_property_value(c.delta_heading)) > 10:
                 done = True
             # if current target heading is reached, random generate a new target heading
             else: